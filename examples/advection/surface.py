@@ -31,10 +31,18 @@ import numpy as np
 import pyopencl as cl
 import pyopencl.tools as cl_tools
 
+from grudge import DiscretizationCollection
 from grudge.array_context import PyOpenCLArrayContext
+from grudge.geometry import normal
+from grudge.models.advection import SurfaceAdvectionOperator
+from grudge.shortcuts import set_up_rk4
 
 from meshmode.dof_array import flatten
 from meshmode.discretization.connection import FACE_RESTR_INTERIOR
+from meshmode.discretization.poly_element import (
+        default_simplex_group_factory, QuadratureSimplexGroupFactory)
+from meshmode.mesh.generation import (
+        make_curve_mesh, ellipse, generate_icosphere)
 
 from pytools.obj_array import make_obj_array
 
@@ -128,13 +136,11 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
     # {{{ discretization
 
     if dim == 2:
-        from meshmode.mesh.generation import make_curve_mesh, ellipse
         mesh = make_curve_mesh(
                 lambda t: radius * ellipse(1.0, t),
                 np.linspace(0.0, 1.0, resolution + 1),
                 order)
     elif dim == 3:
-        from meshmode.mesh.generation import generate_icosphere
         mesh = generate_icosphere(radius, order=4 * order,
                 uniform_refinement_rounds=resolution)
     else:
@@ -146,10 +152,6 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
     else:
         qtag = None
 
-    from meshmode.discretization.poly_element import \
-            default_simplex_group_factory, \
-            QuadratureSimplexGroupFactory
-
     discr_tag_to_group_factory[dof_desc.DISCR_TAG_BASE] = \
         default_simplex_group_factory(base_dim=dim-1, order=order)
 
@@ -157,8 +159,6 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
         discr_tag_to_group_factory[qtag] = \
             QuadratureSimplexGroupFactory(order=4*order)
 
-    from grudge import DiscretizationCollection
-
     dcoll = DiscretizationCollection(
         actx, mesh,
         discr_tag_to_group_factory=discr_tag_to_group_factory
@@ -179,7 +179,6 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
     def f_initial_condition(x):
         return x[0]
 
-    from grudge.models.advection import SurfaceAdvectionOperator
     adv_operator = SurfaceAdvectionOperator(
         dcoll,
         c,
@@ -193,8 +192,6 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
         return adv_operator.operator(t, u)
 
     # check velocity is tangential
-    from grudge.geometry import normal
-
     surf_normal = normal(actx, dcoll, dd=dof_desc.DD_VOLUME)
 
     error = op.norm(dcoll, c.dot(surf_normal), 2)
@@ -207,12 +204,14 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
     # FIXME: dt estimate is not necessarily valid for surfaces
     dt = actx.to_numpy(
         0.45 * adv_operator.estimate_rk4_timestep(actx, dcoll, fields=u0))
-    nsteps = int(final_time // dt) + 1
+
+    # NOTE: shrink dt so that an integer number of steps lands on final_time
+    nsteps = max(1, int(np.ceil(final_time / dt)))
+    dt = final_time / nsteps
 
     logger.info("dt:        %.5e", dt)
     logger.info("nsteps:    %d", nsteps)
 
-    from grudge.shortcuts import set_up_rk4
     dt_stepper = set_up_rk4("u", dt, u0, rhs)
     plot = Plotter(actx, dcoll, order, visualize=visualize)
 
@@ -245,10 +244,14 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
             ("n", face_normal)
             ], overwrite=True)
 
+    # NOTE: every phase counts towards max_steps, including the initial one,
+    # which does not produce a state; hence the extra step
+    t = 0.0
     for event in dt_stepper.run(t_end=final_time, max_steps=nsteps + 1):
         if not isinstance(event, dt_stepper.StateComputed):
             continue
 
+        t = event.t
         step += 1
         if step % 10 == 0:
             norm_u = actx.to_numpy(op.norm(dcoll, event.state_component, 2))
@@ -260,6 +263,9 @@ def main(ctx_factory, dim=2, order=4, use_quad=False, visualize=False):
         # time interval specified
         assert norm_u < 3
 
+    assert step == nsteps
+    assert abs(t - final_time) < 1.0e-12 * final_time
+
     # }}}
 
 
@@ -24,16 +24,22 @@ THE SOFTWARE.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import numpy.linalg as la
 
 import pyopencl as cl
 import pyopencl.tools as cl_tools
 
+from grudge import DiscretizationCollection
 from grudge.array_context import PyOpenCLArrayContext
+from grudge.models.advection import WeakAdvectionOperator
+from grudge.shortcuts import set_up_rk4
 
 from meshmode.dof_array import flatten
 from meshmode.mesh import BTAG_ALL
+from meshmode.mesh.generation import generate_box_mesh
 
 import grudge.dof_desc as dof_desc
 import grudge.op as op
@@ -54,12 +60,15 @@ class Plotter:
             return
 
         if self.dim == 1:
-            import matplotlib.pyplot as pt
-            self.fig = pt.figure(figsize=(8, 8), dpi=300)
             self.ylim = ylim
 
             volume_discr = dcoll.discr_from_dd(dof_desc.DD_VOLUME)
             self.x = actx.to_numpy(flatten(actx.thaw(volume_discr.nodes()[0])))
+
+            # NOTE: rendering and writing the figure happen on a worker thread,
+            # so that they overlap with the following time steps
+            self.executor = ThreadPoolExecutor(max_workers=1)
+            self.futures = []
         else:
             from grudge.shortcuts import make_visualizer
             self.vis = make_visualizer(dcoll)
@@ -69,30 +78,72 @@ class Plotter:
             return
 
         if self.dim == 1:
-            u = self.actx.to_numpy(flatten(evt.state_component))
-
             filename = "%s.png" % basename
             if not overwrite and os.path.exists(filename):
                 from meshmode import FileExistsError
                 raise FileExistsError("output file '%s' already exists" % filename)
 
-            ax = self.fig.gca()
-            ax.plot(self.x, u, "-")
-            ax.plot(self.x, u, "k.")
-            if self.ylim is not None:
-                ax.set_ylim(self.ylim)
-
-            ax.set_xlabel("$x$")
-            ax.set_ylabel("$u$")
-            ax.set_title(f"t = {evt.t:.2f}")
-
-            self.fig.savefig(filename)
-            self.fig.clf()
+            # NOTE: the device-to-host copies are only started here and waited
+            # for on the worker thread, so that they overlap with the following
+            # time steps. Each group is copied straight into its slice of the
+            # host buffer, which avoids a flattened temporary on the device.
+            # Every plot gets its own buffer, since it is filled after this
+            # call returns.
+            u = np.empty_like(self.x)
+            copy_evts = []
+            istart = 0
+            for grp_ary in evt.state_component:
+                iend = istart + grp_ary.size
+                _, copy_evt = grp_ary.get_async(
+                        queue=self.actx.queue,
+                        ary=u[istart:iend].reshape(grp_ary.shape))
+                # NOTE: no copy is enqueued (and no event returned) for
+                # empty groups
+                if copy_evt is not None:
+                    copy_evts.append(copy_evt)
+                istart = iend
+
+            # NOTE: submit the copies now rather than when the worker waits
+            self.actx.queue.flush()
+            self.futures.append(self.executor.submit(
+                self.render, u, copy_evts, evt.t, filename))
         else:
             self.vis.write_vtk_file("%s.vtu" % basename, [
                 ("u", evt.state_component)
                 ], overwrite=overwrite)
 
+    def render(self, u, copy_evts, t, filename):
+        if copy_evts:
+            cl.wait_for_events(copy_evts)
+
+        # NOTE: pyplot is not thread-safe, so a standalone figure is created
+        # for every plot instead of sharing one through pyplot
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(8, 8), dpi=300)
+
+        ax = fig.gca()
+        ax.plot(self.x, u, "-")
+        ax.plot(self.x, u, "k.")
+        if self.ylim is not None:
+            ax.set_ylim(self.ylim)
+
+        ax.set_xlabel("$x$")
+        ax.set_ylabel("$u$")
+        ax.set_title(f"t = {t:.2f}")
+
+        fig.savefig(filename)
+
+    def close(self):
+        if not self.visualize or self.dim != 1:
+            return
+
+        for future in self.futures:
+            # NOTE: re-raises any exception from the worker
+            future.result()
+
+        self.executor.shutdown()
+        self.futures = []
+
 # }}}
 
 
@@ -126,13 +177,10 @@ def main(ctx_factory, dim=2, order=4, visualize=False):
 
     # {{{ discretization
 
-    from meshmode.mesh.generation import generate_box_mesh
     mesh = generate_box_mesh(
             [np.linspace(-d/2, d/2, npoints) for _ in range(dim)],
             order=order)
 
-    from grudge import DiscretizationCollection
-
     dcoll = DiscretizationCollection(actx, mesh, order=order)
 
     # }}}
@@ -145,8 +193,6 @@ def main(ctx_factory, dim=2, order=4, visualize=False):
     def u_analytic(x, t=0):
         return f(-np.dot(c, x) / norm_c + t * norm_c)
 
-    from grudge.models.advection import WeakAdvectionOperator
-
     adv_operator = WeakAdvectionOperator(
         dcoll,
         c,
@@ -171,27 +217,31 @@ def main(ctx_factory, dim=2, order=4, visualize=False):
 
     # {{{ time stepping
 
-    from grudge.shortcuts import set_up_rk4
     dt_stepper = set_up_rk4("u", dt, u, rhs)
     plot = Plotter(actx, dcoll, order, visualize=visualize,
             ylim=[-1.1, 1.1])
 
     step = 0
     norm_u = 0.0
-    for event in dt_stepper.run(t_end=final_time):
-        if not isinstance(event, dt_stepper.StateComputed):
-            continue
-
-        if step % 10 == 0:
-            norm_u = actx.to_numpy(op.norm(dcoll, event.state_component, 2))
-            plot(event, "fld-weak-%04d" % step)
-
-        step += 1
-        logger.info("[%04d] t = %.5f |u| = %.5e", step, event.t, norm_u)
-
-        # NOTE: These are here to ensure the solution is bounded for the
-        # time interval specified
-        assert norm_u < 1
+    try:
+        for event in dt_stepper.run(t_end=final_time):
+            if not isinstance(event, dt_stepper.StateComputed):
+                continue
+
+            if step % 10 == 0:
+                norm_u = actx.to_numpy(op.norm(dcoll, event.state_component, 2))
+                plot(event, "fld-weak-%04d" % step)
+
+            step += 1
+            logger.info("[%04d] t = %.5f |u| = %.5e", step, event.t, norm_u)
+
+            # NOTE: These are here to ensure the solution is bounded for the
+            # time interval specified
+            assert norm_u < 1
+    finally:
+        # NOTE: wait for pending plots even if the run fails, so that errors
+        # from the worker are not lost
+        plot.close()
 
     # }}}
 
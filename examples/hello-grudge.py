@@ -10,6 +10,7 @@
 # BEGINEXAMPLE
 import numpy as np
 import pyopencl as cl
+import pyopencl.tools as cl_tools
 from grudge.discretization import DiscretizationCollection
 import grudge.op as op
 from meshmode.mesh.generation import generate_box_mesh
@@ -19,7 +20,9 @@ from grudge.dof_desc import DTAG_BOUNDARY, FACE_RESTR_INTERIOR
 
 ctx = cl.create_some_context()
 queue = cl.CommandQueue(ctx)
-actx = PyOpenCLArrayContext(queue)
+actx = PyOpenCLArrayContext(
+    queue,
+    allocator=cl_tools.MemoryPool(cl_tools.ImmediateAllocator(queue)))
 
 nel = 10
 coords = np.linspace(0, 2*np.pi, nel)
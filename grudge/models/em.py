@@ -201,8 +201,7 @@ class MaxwellOperator(HyperbolicOperator):
         """
         e, h = self.split_eh(w)
 
-        pec_e = op.project(self.dcoll, "vol", self.pec_tag, e)
-        pec_h = op.project(self.dcoll, "vol", self.pec_tag, h)
+        pec_e, pec_h = op.project_many(self.dcoll, "vol", self.pec_tag, (e, h))
 
         return flat_obj_array(-pec_e, pec_h)
 
@@ -211,8 +210,7 @@ class MaxwellOperator(HyperbolicOperator):
         """
         e, h = self.split_eh(w)
 
-        pmc_e = op.project(self.dcoll, "vol", self.pmc_tag, e)
-        pmc_h = op.project(self.dcoll, "vol", self.pmc_tag, h)
+        pmc_e, pmc_h = op.project_many(self.dcoll, "vol", self.pmc_tag, (e, h))
 
         return flat_obj_array(pmc_e, -pmc_h)
 
@@ -233,8 +231,8 @@ class MaxwellOperator(HyperbolicOperator):
         absorb_Z = (mu/epsilon)**0.5  # noqa: N806
         absorb_Y = 1/absorb_Z  # noqa: N806
 
-        absorb_e = op.project(self.dcoll, "vol", self.absorb_tag, e)
-        absorb_h = op.project(self.dcoll, "vol", self.absorb_tag, h)
+        absorb_e, absorb_h = op.project_many(
+            self.dcoll, "vol", self.absorb_tag, (e, h))
 
         bc = flat_obj_array(
                 absorb_e + 1/2*(self.space_cross_h(absorb_normal, self.space_cross_e(
@@ -115,8 +115,7 @@ class WeakWaveOperator(HyperbolicOperator):
         # boundary conditions -------------------------------------------------
 
         # dirichlet BCs -------------------------------------------------------
-        dir_u = op.project(dcoll, "vol", self.dirichlet_tag, u)
-        dir_v = op.project(dcoll, "vol", self.dirichlet_tag, v)
+        dir_u, dir_v = op.project_many(dcoll, "vol", self.dirichlet_tag, (u, v))
         if self.dirichlet_bc_f:
             # FIXME
             from warnings import warn
@@ -129,15 +128,13 @@ class WeakWaveOperator(HyperbolicOperator):
             dir_bc = flat_obj_array(-dir_u, dir_v)
 
         # neumann BCs ---------------------------------------------------------
-        neu_u = op.project(dcoll, "vol", self.neumann_tag, u)
-        neu_v = op.project(dcoll, "vol", self.neumann_tag, v)
+        neu_u, neu_v = op.project_many(dcoll, "vol", self.neumann_tag, (u, v))
         neu_bc = flat_obj_array(neu_u, -neu_v)
 
         # radiation BCs -------------------------------------------------------
         rad_normal = actx.thaw(dcoll.normal(dd=self.radiation_tag))
 
-        rad_u = op.project(dcoll, "vol", self.radiation_tag, u)
-        rad_v = op.project(dcoll, "vol", self.radiation_tag, v)
+        rad_u, rad_v = op.project_many(dcoll, "vol", self.radiation_tag, (u, v))
 
         rad_bc = flat_obj_array(
             0.5*(rad_u - self.sign*np.dot(rad_normal, rad_v)),
@@ -273,9 +270,8 @@ class VariableCoefficientWeakWaveOperator(HyperbolicOperator):
         # boundary conditions -------------------------------------------------
 
         # dirichlet BCs -------------------------------------------------------
-        dir_c = op.project(dcoll, "vol", self.dirichlet_tag, c)
-        dir_u = op.project(dcoll, "vol", self.dirichlet_tag, u)
-        dir_v = op.project(dcoll, "vol", self.dirichlet_tag, v)
+        dir_c, dir_u, dir_v = op.project_many(
+            dcoll, "vol", self.dirichlet_tag, (c, u, v))
         if self.dirichlet_bc_f:
             # FIXME
             from warnings import warn
@@ -288,18 +284,15 @@ class VariableCoefficientWeakWaveOperator(HyperbolicOperator):
             dir_bc = flat_obj_array(dir_c, -dir_u, dir_v)
 
         # neumann BCs ---------------------------------------------------------
-        neu_c = op.project(dcoll, "vol", self.neumann_tag, c)
-        neu_u = op.project(dcoll, "vol", self.neumann_tag, u)
-        neu_v = op.project(dcoll, "vol", self.neumann_tag, v)
+        neu_c, neu_u, neu_v = op.project_many(
+            dcoll, "vol", self.neumann_tag, (c, u, v))
         neu_bc = flat_obj_array(neu_c, neu_u, -neu_v)
 
         # radiation BCs -------------------------------------------------------
         rad_normal = actx.thaw(dcoll.normal(dd=self.radiation_tag))
 
-        rad_c = op.project(dcoll, "vol", self.radiation_tag, c)
-        rad_u = op.project(dcoll, "vol", self.radiation_tag, u)
-        rad_v = op.project(dcoll, "vol", self.radiation_tag, v)
-        rad_sign = op.project(dcoll, "vol", self.radiation_tag, actx.thaw(self.sign))
+        rad_c, rad_u, rad_v, rad_sign = op.project_many(
+            dcoll, "vol", self.radiation_tag, (c, u, v, actx.thaw(self.sign)))
 
         rad_bc = flat_obj_array(
             rad_c,
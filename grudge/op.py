@@ -90,7 +90,7 @@ import numpy as np
 import grudge.dof_desc as dof_desc
 
 from grudge.interpolation import interp
-from grudge.projection import project
+from grudge.projection import project, project_many
 
 from grudge.reductions import (
     norm,
@@ -122,6 +122,7 @@ from grudge.trace_pair import (
 
 __all__ = (
     "project",
+    "project_many",
     "interp",
 
     "norm",
@@ -5,6 +5,7 @@ Projections
 -----------
 
 .. autofunction:: project
+.. autofunction:: project_many
 """
 
 from __future__ import annotations
@@ -34,12 +35,27 @@ THE SOFTWARE.
 """
 
 
-from arraycontext import ArrayOrContainer
+from numbers import Number
+
+from arraycontext import (
+    ArrayOrContainer,
+    NotAnArrayContainerError,
+    serialize_container,
+    deserialize_container,
+)
 
 from grudge.discretization import DiscretizationCollection
 from grudge.dof_desc import as_dofdesc
 
-from numbers import Number
+from meshmode.dof_array import DOFArray
+
+import numpy as np
+
+
+# NOTE: concrete types, since isinstance checks against them are much cheaper
+# than against the numbers.Number ABC. They are only a fast path: other
+# Numbers (e.g. fractions.Fraction) are still caught by the ABC check.
+_SCALAR_TYPES = (int, float, complex, np.number)
 
 
 def project(
@@ -55,10 +71,70 @@ def project(
     :returns: a :class:`~meshmode.dof_array.DOFArray` or an
         :class:`~arraycontext.ArrayContainer` like *vec*.
     """
+    # NOTE: callers typically pass the same DOFDesc instance for both ends
+    # (e.g. DD_VOLUME), in which case there is nothing to do
+    if src is tgt:
+        return vec
+
     src = as_dofdesc(src)
     tgt = as_dofdesc(tgt)
 
-    if isinstance(vec, Number) or src == tgt:
+    if src == tgt:
         return vec
 
-    return dcoll.connection_from_dds(src, tgt)(vec)
+    # NOTE: DOFArrays are by far the most common input, so they are checked
+    # for first and take a single type test to reach the connection.
+    # connection_from_dds is memoized on the coerced descriptors, so the
+    # lookup amounts to a dictionary access after the first call.
+    if isinstance(vec, DOFArray):
+        return dcoll.connection_from_dds(src, tgt)(vec)
+
+    if isinstance(vec, _SCALAR_TYPES) or isinstance(vec, Number):
+        return vec
+
+    return _project_with_connection(dcoll.connection_from_dds(src, tgt), vec)
+
+
+def _project_with_connection(conn, vec):
+    """Apply *conn* to every :class:`~meshmode.dof_array.DOFArray` in the
+    container *vec*, passing scalar leaves through unchanged.
+    """
+    if isinstance(vec, DOFArray):
+        return conn(vec)
+
+    if isinstance(vec, _SCALAR_TYPES) or isinstance(vec, Number):
+        return vec
+
+    try:
+        iterable = serialize_container(vec)
+    except NotAnArrayContainerError:
+        raise TypeError(
+            f"cannot project object of type '{type(vec).__name__}'") from None
+
+    return deserialize_container(vec, [
+        (key, _project_with_connection(conn, subvec))
+        for key, subvec in iterable])
+
+
+def project_many(
+        dcoll: DiscretizationCollection, src, tgt, vecs) -> tuple:
+    r"""Project each entry of *vecs* from *src* to *tgt*, as in :func:`project`.
+
+    The descriptors are coerced and the connection is looked up only once,
+    which makes this preferable to repeated calls to :func:`project` when
+    many fields are moved between the same pair of discretizations.
+
+    :arg src: a :class:`~grudge.dof_desc.DOFDesc`, or a value convertible to one.
+    :arg tgt: a :class:`~grudge.dof_desc.DOFDesc`, or a value convertible to one.
+    :arg vecs: an iterable of :class:`~meshmode.dof_array.DOFArray`\ s or
+        :class:`~arraycontext.ArrayContainer`\ s of them.
+    :returns: a :class:`tuple` of the projected entries of *vecs*, in order.
+    """
+    src = as_dofdesc(src)
+    tgt = as_dofdesc(tgt)
+
+    if src == tgt:
+        return tuple(vecs)
+
+    conn = dcoll.connection_from_dds(src, tgt)
+    return tuple(_project_with_connection(conn, vec) for vec in vecs)
@@ -73,7 +73,8 @@ from grudge.discretization import DiscretizationCollection
 from pytools import memoize_in
 
 from meshmode.dof_array import DOFArray
-from meshmode.transform_metadata import DiscretizationDOFAxisTag
+from meshmode.transform_metadata import (
+    DiscretizationDOFAxisTag, FirstAxisIsElementsTag)
 
 import numpy as np
 import grudge.dof_desc as dof_desc
@@ -102,19 +103,75 @@ def norm(dcoll: DiscretizationCollection, vec, p, dd=None) -> Scalar:
     dd = dof_desc.as_dofdesc(dd)
 
     if p == 2:
-        from grudge.op import _apply_mass_operator
-        return actx.np.sqrt(
-            actx.np.abs(
-                nodal_sum(
-                    dcoll, dd,
-                    actx.np.conjugate(vec)
-                    * _apply_mass_operator(dcoll, dd, dd, vec))))
+        return actx.np.sqrt(actx.np.abs(_mass_inner_product(dcoll, dd, vec)))
     elif p == np.inf:
         return nodal_max(dcoll, dd, actx.np.abs(vec), initial=0.)
     else:
         raise ValueError("unsupported norm order")
 
 
+def _mass_inner_product(dcoll: DiscretizationCollection, dd, vec) -> Scalar:
+    r"""Return :math:`\mathbf{f}^H \mathbf{M} \mathbf{f}` for the vector of
+    degrees of freedom *vec*, summed over all ranks.
+    """
+    comm = dcoll.mpi_communicator
+    if comm is None:
+        return _mass_inner_product_loc(dcoll, dd, vec)
+
+    # NOTE: Don't move this
+    from mpi4py import MPI
+
+    from arraycontext import get_container_context_recursively
+    actx = get_container_context_recursively(vec)
+
+    return actx.from_numpy(
+        comm.allreduce(
+            actx.to_numpy(_mass_inner_product_loc(dcoll, dd, vec)),
+            op=MPI.SUM))
+
+
+def _mass_inner_product_loc(
+        dcoll: DiscretizationCollection, dd, vec) -> Scalar:
+    if not isinstance(vec, DOFArray):
+        return sum(
+            _mass_inner_product_loc(dcoll, dd, comp)
+            for _, comp in serialize_container(vec)
+        )
+
+    from grudge.geometry import area_element
+    from grudge.op import reference_mass_matrix
+
+    actx = vec.array_context
+    discr = dcoll.discr_from_dd(dd)
+    area_elements = area_element(actx, dcoll, dd=dd,
+            _use_geoderiv_connection=actx.supports_nonscalar_broadcasting)
+
+    if vec.entry_dtype.kind == "c":
+        vec_conj = actx.np.conjugate(vec)
+    else:
+        vec_conj = vec
+
+    # NOTE: The mass matrix application and the product with the conjugate
+    # are fused into one per-element contraction, so that M f is never stored.
+    # The element axis is kept as the output (and tagged) so that the array
+    # context can parallelize over elements before the final sum.
+    return sum([
+        actx.np.sum(
+            actx.einsum("ei,ij,ej,ej->e",
+                        vec_conj_i,
+                        reference_mass_matrix(
+                            actx,
+                            out_element_group=grp,
+                            in_element_group=grp),
+                        ae_i,
+                        vec_i,
+                        arg_names=("vec_conj", "mass_mat", "jac", "vec"),
+                        tagged=(FirstAxisIsElementsTag(),)))
+        if vec_i.size else actx.from_numpy(np.array(0.))
+        for grp, ae_i, vec_i, vec_conj_i in zip(
+            discr.groups, area_elements, vec, vec_conj)])
+
+
 def nodal_sum(dcoll: DiscretizationCollection, dd, vec) -> Scalar:
     r"""Return the nodal sum of a vector of degrees of freedom *vec*.
 
@@ -525,8 +525,25 @@ def cross_rank_trace_pairs(
         for remote_rank in connected_ranks(dcoll)
     ]
 
-    # Complete send/receives and return communicated data
-    return [rc.finish() for rc in rank_bdry_communcators]
+    if not rank_bdry_communcators:
+        return []
+
+    if rbc is _RankBoundaryCommunicationLazy:
+        # Complete send/receives and return communicated data
+        return [rc.finish() for rc in rank_bdry_communcators]
+
+    # Complete the receives in the order in which they arrive, so that the
+    # unflattening and boundary swap for one neighbor overlaps with the
+    # communication still in flight for the others. The returned list is
+    # still ordered like connected_ranks(dcoll).
+    from mpi4py import MPI
+    recv_reqs = [rc.recv_req for rc in rank_bdry_communcators]
+    tpairs = {}
+    for _ in range(len(rank_bdry_communcators)):
+        idx = MPI.Request.Waitany(recv_reqs)
+        tpairs[idx] = rank_bdry_communcators[idx].finish()
+
+    return [tpairs[idx] for idx in range(len(rank_bdry_communcators))]
 
 # }}}
 
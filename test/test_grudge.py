@@ -1043,6 +1043,69 @@ def test_norm_obj_array(actx_factory, p):
     assert abs(norm-ref_norm) / abs(ref_norm) < 1e-14
 
 
+def test_project_container_with_scalars(actx_factory):
+    from meshmode.mesh import BTAG_ALL
+
+    actx = actx_factory()
+
+    dim = 2
+    mesh = mgen.generate_regular_rect_mesh(
+            a=(-0.5,)*dim, b=(0.5,)*dim,
+            nelements_per_axis=(4,)*dim, order=4)
+    dcoll = DiscretizationCollection(actx, mesh, order=4)
+    nodes = actx.thaw(dcoll.nodes())
+
+    prj_vec = op.project(dcoll, "vol", BTAG_ALL, flat_obj_array(nodes[0], 2.0))
+    assert prj_vec[1] == 2.0
+
+    bdry_nodes = actx.thaw(dcoll.nodes(dd=BTAG_ALL))
+    assert actx.to_numpy(
+            op.norm(dcoll, prj_vec[0] - bdry_nodes[0], np.inf, dd=BTAG_ALL)
+            ) < 1.0e-14
+
+    # numbers beyond the builtin and numpy scalar types pass through as well
+    from fractions import Fraction
+    assert op.project(dcoll, "vol", BTAG_ALL, Fraction(1, 3)) == Fraction(1, 3)
+
+    with pytest.raises(TypeError):
+        op.project(dcoll, "vol", BTAG_ALL, None)
+
+
+def test_project_many(actx_factory):
+    from meshmode.mesh import BTAG_ALL
+
+    actx = actx_factory()
+
+    dim = 2
+    mesh = mgen.generate_regular_rect_mesh(
+            a=(-0.5,)*dim, b=(0.5,)*dim,
+            nelements_per_axis=(4,)*dim, order=4)
+    dcoll = DiscretizationCollection(actx, mesh, order=4)
+    nodes = actx.thaw(dcoll.nodes())
+
+    vecs = (nodes[0], actx.np.sin(nodes[1]), nodes, 2.0)
+    projected = op.project_many(dcoll, "vol", BTAG_ALL, vecs)
+
+    assert len(projected) == len(vecs)
+
+    # the projected volume nodes must be the boundary nodes
+    bdry_nodes = actx.thaw(dcoll.nodes(dd=BTAG_ALL))
+    assert actx.to_numpy(
+            op.norm(dcoll, projected[2] - bdry_nodes, np.inf, dd=BTAG_ALL)
+            ) < 1.0e-14
+
+    for vec, prj_vec in zip(vecs, projected):
+        ref_vec = op.project(dcoll, "vol", BTAG_ALL, vec)
+        if np.isscalar(vec):
+            assert prj_vec == ref_vec
+        else:
+            assert actx.to_numpy(
+                    op.norm(dcoll, prj_vec - ref_vec, np.inf, dd=BTAG_ALL)) == 0
+
+    assert all(prj_vec is vec for vec, prj_vec in zip(
+        vecs, op.project_many(dcoll, "vol", "vol", vecs)))
+
+
 def test_empty_boundary(actx_factory):
     # https://github.com/inducer/grudge/issues/54
 
@@ -1062,6 +1125,21 @@ def test_empty_boundary(actx_factory):
         assert len(component) == len(dcoll.discr_from_dd(BTAG_NONE).groups)
 
 
+def test_empty_boundary_norm(actx_factory):
+    from meshmode.mesh import BTAG_NONE
+
+    actx = actx_factory()
+
+    dim = 2
+    mesh = mgen.generate_regular_rect_mesh(
+            a=(-0.5,)*dim, b=(0.5,)*dim,
+            nelements_per_axis=(8,)*dim, order=4)
+    dcoll = DiscretizationCollection(actx, mesh, order=4)
+
+    bdry_x = actx.thaw(dcoll.nodes(dd=BTAG_NONE))[0]
+    assert actx.to_numpy(op.norm(dcoll, bdry_x, 2, dd=BTAG_NONE)) == 0
+
+
 # You can test individual routines by typing
 # $ python test_grudge.py 'test_routine()'
 
@@ -66,9 +66,11 @@ def run_test_with_mpi(num_ranks, f, *args):
     invocation_info = b64encode(dumps((f, args))).decode()
     from subprocess import check_call
 
-    # NOTE: CI uses OpenMPI; -x to pass env vars. MPICH uses -env
+    # NOTE: CI uses OpenMPI; -x to pass env vars. MPICH uses -env.
+    # --oversubscribe (also OpenMPI) lets runners with fewer cores than
+    # num_ranks still launch all the ranks.
     check_call([
-        "mpiexec", "-np", str(num_ranks),
+        "mpiexec", "-np", str(num_ranks), "--oversubscribe",
         "-x", "RUN_WITHIN_MPI=1",
         "-x", f"INVOCATION_INFO={invocation_info}",
         sys.executable, __file__])
@@ -100,7 +102,7 @@ def run_test_with_mpi_inner():
 # {{{ func_comparison
 
 @pytest.mark.parametrize("actx_class", DISTRIBUTED_ACTXS)
-@pytest.mark.parametrize("num_ranks", [2])
+@pytest.mark.parametrize("num_ranks", [2, 4])
 def test_func_comparison_mpi(actx_class, num_ranks):
     run_test_with_mpi(
             num_ranks, _test_func_comparison_mpi_communication_entrypoint,
@@ -160,6 +162,16 @@ def _test_func_comparison_mpi_communication_entrypoint(actx):
                       comm_tag=SimpleTag))
         ) - (all_faces_func - bdry_faces_func)
 
+    if not isinstance(actx, MPIPytatoArrayContext):
+        # eager receives complete in arrival order; make sure the trace pairs
+        # still come back ordered like the connected ranks
+        from meshmode.mesh import BTAG_PARTITION
+        from grudge.trace_pair import connected_ranks
+        tpairs = op.cross_rank_trace_pairs(dcoll, myfunc, comm_tag=SimpleTag)
+        assert [tpair.dd for tpair in tpairs] == [
+                as_dofdesc(BTAG_PARTITION(remote_rank))
+                for remote_rank in connected_ranks(dcoll)]
+
     hopefully_zero_result = actx.compile(hopefully_zero)()
 
     error = actx.to_numpy(flat_norm(hopefully_zero_result, ord=np.inf))